@@ -3,13 +3,26 @@ Bridge Core - Universal coordination logic for Claude Desktop bridge
 Platform-agnostic orchestration of message flow with streaming support
 """
 
+import atexit
 import time
+import logging
 import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional, Callable
-from datetime import datetime
 
-from .claude_api import send_to_claude, start_websocket_monitoring, health_check
+from .claude_api import (
+    _CONNECT_TIMEOUT,
+    _SESSION,
+    _dumps,
+    _loads,
+    send_to_claude,
+    health_check,
+    get_shared_websocket_client,
+    register_anchor_callback,
+    unregister_anchor_callback
+)
 from .message_processing import (
     frame_message_with_context, 
     format_for_platform,
@@ -17,6 +30,37 @@ from .message_processing import (
     clean_mention_from_message
 )
 
+logger = logging.getLogger(__name__)
+
+# Rolling estimate of how long Claude takes to answer, used to pace the
+# fallback poll: quick replies get polled sooner, slow ones less often
+_response_time_ewma = 5.0
+
+# Streaming events that all share the one update/flush code path below
+_STREAM_UPDATE_EVENTS = frozenset({'response_update', 'response_complete', 'response_streaming'})
+
+# Don't re-run the platform formatter for tiny stream growth; wait until at
+# least this many new characters have arrived (completion always flushes)
+_MIN_STREAM_DELTA = 64
+
+# Bounded pool for response monitors - reuses thread stacks and caps
+# concurrency under mention bursts instead of one unbounded thread per message
+_MONITOR_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="claude-mon")
+
+# Pool workers are non-daemon (unlike the per-message daemon threads they
+# replaced) and get joined at interpreter shutdown, so in-flight monitors
+# must be told to stop or Ctrl+C/SIGTERM hangs exit for up to the 180s
+# monitor timeout. Interfaces set this from stop(); atexit covers the rest.
+_MONITOR_STOP = threading.Event()
+
+
+def shutdown_monitors() -> None:
+    """Signal in-flight response monitors to exit promptly"""
+    _MONITOR_STOP.set()
+
+
+atexit.register(shutdown_monitors)
+
 
 def handle_incoming_message(message: str, user_info: Optional[Dict] = None,
                            platform_info: Optional[Dict] = None,
@@ -39,13 +83,13 @@ def handle_incoming_message(message: str, user_info: Optional[Dict] = None,
         Anchor hash for response monitoring, or None if failed
     """
     try:
-        print(f"🎯 Processing message from {platform_type}: {message[:50]}...")
+        logger.info("Processing message from %s: %.50s...", platform_type, message)
         
         # Clean the message (remove mentions, etc.)
         clean_message = clean_mention_from_message(message)
         
         if not clean_message.strip():
-            print("❌ No content after cleaning message")
+            logger.warning("No content after cleaning message")
             return None
         
         # Frame the message with context
@@ -62,20 +106,18 @@ def handle_incoming_message(message: str, user_info: Optional[Dict] = None,
         if anchor_hash:
             # Start monitoring for response in background
             if response_callback:
-                monitor_thread = threading.Thread(
-                    target=_monitor_and_callback,
-                    args=(anchor_hash, platform_type, response_callback, api_url),
-                    daemon=True
+                _MONITOR_POOL.submit(
+                    _monitor_and_callback,
+                    anchor_hash, platform_type, response_callback, api_url
                 )
-                monitor_thread.start()
-            
+
             return anchor_hash
         else:
-            print("❌ Failed to send message to Claude")
+            logger.error("Failed to send message to Claude")
             return None
             
     except Exception as e:
-        print(f"❌ Error handling message: {e}")
+        logger.error("Error handling message: %s", e)
         return None
 
 
@@ -91,132 +133,179 @@ def _monitor_and_callback(anchor_hash: str, platform_type: str,
         callback: Function to call with formatted response
     """
     try:
-        print(f"📡 Starting WebSocket streaming monitor for {platform_type}...")
+        logger.info("Starting WebSocket streaming monitor for %s...", platform_type)
         
         last_content = ""
+        last_len = 0
+        last_formatted = ""
         response_complete = False
-        
+        last_ws_event_time = 0.0
+        done_event = threading.Event()
+
         def stream_callback(event_name, *args):
-            nonlocal last_content, response_complete
-            
-            print(args[0])
-            # Handle proactive response updates
-            if event_name in ['response_update', 'response_complete'] and args:
-                data = args[0]
-                if data.get('anchor') == anchor_hash:
-                    content = data.get('content', '')
-                    complete = data.get('complete', False)
-                    
-                    if content and content != last_content:
-                        # Send incremental updates as they arrive - let platform decide how to handle
-                        print(f"📥 WebSocket content update: {len(content)} chars (complete: {complete})")
-                        formatted = format_for_platform(content, platform_type)
+            nonlocal last_content, last_len, last_formatted, response_complete, last_ws_event_time
+
+            # Ignore anything that isn't for our anchor before touching the
+            # payload - with the shared client every monitor sees every event
+            if not args or not isinstance(args[0], dict) or args[0].get('anchor') != anchor_hash:
+                return
+            data = args[0]
+
+            # Any event for our anchor proves the WebSocket path is alive
+            last_ws_event_time = time.monotonic()
+
+            # Single code path for every streaming update event;
+            # 'response_complete' implies completion even when the payload
+            # flag is missing
+            if event_name in _STREAM_UPDATE_EVENTS:
+                content = data.get('content', '')
+                complete = data.get('complete', False) or event_name == 'response_complete'
+
+                # Length check is O(1); the stream only ever grows, so a
+                # changed length is equivalent to changed content here
+                if content and len(content) != last_len:
+                    # Coalesce typing-speed updates - formatting a huge
+                    # response for every few new characters is wasted work
+                    if not complete and len(content) - last_len < _MIN_STREAM_DELTA:
+                        return
+
+                    logger.debug("Stream update: %d chars (complete=%s)", len(content), complete)
+                    formatted = format_for_platform(content, platform_type)
+                    # Legacy streaming events can surface UI noise early on,
+                    # so they keep the substantial-response filter
+                    if formatted and (event_name != 'response_streaming' or
+                                      is_substantial_response(formatted)):
+                        last_formatted = formatted
                         callback(formatted)
                         last_content = content
-                        
-                        if complete or event_name == 'response_complete':
-                            response_complete = True
-                            print("✅ Response marked complete via WebSocket")
-            
-            # Legacy streaming support (keeping for compatibility)
-            elif event_name == 'response_streaming' and args:
-                data = args[0]
-                if data.get('anchor') == anchor_hash:
-                    content = data.get('content', '')
-                    complete = data.get('complete', False)
-                    
-                    if content and content != last_content:
-                        # Send incremental updates - let platform handle appropriately
-                        formatted = format_for_platform(content, platform_type)
-                        if formatted and is_substantial_response(formatted):
-                            print(f"📤 Streaming update: {len(formatted)} chars (complete: {complete})")
-                            callback(formatted)
-                            last_content = content
-                            
-                    if complete and not response_complete:
+                        last_len = len(content)
+
+                    if complete:
                         response_complete = True
-                        print(f"✅ Stream complete for {anchor_hash}")
-            
-            elif event_name == 'response_monitored' and args:
-                data = args[0]
-                if data.get('anchor') == anchor_hash and not response_complete:
+                        done_event.set()
+                        logger.debug("Stream complete for %s", anchor_hash)
+                elif complete and not response_complete:
+                    # Completion event re-delivering content we already
+                    # formatted - reuse the cached result instead of
+                    # running the formatter over the whole response again
+                    if last_formatted:
+                        callback(last_formatted)
+                    response_complete = True
+                    done_event.set()
+                    logger.debug("Stream complete for %s (content unchanged)", anchor_hash)
+
+            elif event_name == 'response_monitored':
+                if not response_complete:
                     # Final fallback if streaming didn't work
-                    print("📡 Using fallback response monitoring")
+                    logger.info("Using fallback response monitoring")
                     if not last_content:
                         callback("❌ No response received from Claude Desktop")
         
-        # Start WebSocket monitoring with streaming callback
-        websocket_client = start_websocket_monitoring(event_callback=stream_callback)
-        
+        # Register with the shared WebSocket client - no per-message handshake
+        websocket_client = get_shared_websocket_client(api_url)
+        register_anchor_callback(anchor_hash, stream_callback)
+
         # Hybrid approach: WebSocket + Polling
+        global _response_time_ewma
         timeout_seconds = 180
-        start_time = time.time()
+        start_time = time.monotonic()
         last_poll_time = 0
-        poll_interval = 3  # Poll every 3 seconds as fallback
-        
-        while (time.time() - start_time) < timeout_seconds and not response_complete:
-            current_time = time.time()
-            
-            # Polling fallback - monitor for anchor-specific content
-            if current_time - last_poll_time >= poll_interval:
-                try:
-                    print("🔄 Polling for response content...")
-                    payload = {
-                        'anchor': anchor_hash,
-                        'timeout': 5000  # 5 second timeout for polling
-                    }
-                    response = requests.post(f"{api_url}/claude/monitor", 
-                                           json=payload, 
-                                           timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('success') and data.get('content'):
-                            print(f"📥 Polled content: {len(data['content'])} chars")
-                            
-                            # Send incremental updates from polling as well
-                            new_content = data['content']
-                            if new_content != last_content:
-                                print(f"📤 Polling update: {len(new_content)} chars (complete: {data.get('complete', False)})")
-                                last_content = new_content
-                                callback(new_content)
-                                if data.get('complete', False):
-                                    response_complete = True
-                                    break
+        # Pace the fallback poll from observed response latency
+        base_poll_interval = max(1.0, min(30.0, 0.25 * _response_time_ewma))
+        max_poll_interval = 30
+        poll_interval = base_poll_interval
+
+        # The poll request never changes shape - build and serialize it
+        # once, then freeze URL, body and timeout into a C-level partial so
+        # each poll is a plain call with no argument re-packing
+        poll = partial(
+            _SESSION.post,
+            f"{api_url}/claude/monitor",
+            data=_dumps({
+                'anchor': anchor_hash,
+                'timeout': 5000  # 5 second timeout for polling
+            }),
+            timeout=(_CONNECT_TIMEOUT, 10))
+
+        try:
+            while ((time.monotonic() - start_time) < timeout_seconds and
+                   not response_complete and not _MONITOR_STOP.is_set()):
+                current_time = time.monotonic()
+
+                # Skip the HTTP fallback entirely while the WebSocket is connected
+                # and delivering events for this anchor - polling is redundant then
+                ws_delivering = (websocket_client and websocket_client.connected and
+                                 (current_time - last_ws_event_time) < poll_interval)
+
+                # Polling fallback - monitor for anchor-specific content
+                if not ws_delivering and current_time - last_poll_time >= poll_interval:
+                    try:
+                        logger.debug("Polling for response content...")
+                        response = poll()
+                        if response.status_code == 200:
+                            data = _loads(response.content)
+                            if data.get('success') and data.get('content'):
+                                logger.debug("Polled content: %d chars", len(data['content']))
+
+                                # Send incremental updates from polling as well
+                                new_content = data['content']
+                                if len(new_content) != last_len or new_content != last_content:
+                                    logger.debug("Polling update: %d chars (complete=%s)", len(new_content), data.get('complete', False))
+                                    last_content = new_content
+                                    last_len = len(new_content)
+                                    callback(new_content)
+                                    poll_interval = base_poll_interval
+                                    if data.get('complete', False):
+                                        response_complete = True
+                                        break
+                                else:
+                                    # Nothing new - back off so idle polls get rarer
+                                    poll_interval = min(poll_interval * 2, max_poll_interval)
+                            else:
+                                logger.debug("Poll response: success=%s, has_content=%s", data.get('success'), bool(data.get('content')))
+                                poll_interval = min(poll_interval * 2, max_poll_interval)
                         else:
-                            print(f"📡 Poll response: success={data.get('success')}, has_content={bool(data.get('content'))}")
-                    else:
-                        print(f"❌ Poll failed with status: {response.status_code}")
-                except requests.RequestException as e:
-                    print(f"❌ Polling error (likely timeout): {e}")
+                            logger.warning("Poll failed with status: %s", response.status_code)
+                    except requests.RequestException as e:
+                        logger.warning("Polling error (likely timeout): %s", e)
                 
-                last_poll_time = current_time
-            
-            time.sleep(1)
-        
+                    last_poll_time = current_time
+                elif ws_delivering and current_time - last_poll_time >= poll_interval:
+                    # WebSocket is carrying the stream - push the fallback poll out
+                    last_poll_time = current_time
+
+                # Sleep until the next poll is due, waking immediately on
+                # completion; cap the nap so a stop signal is honored
+                # within seconds rather than after a full poll interval
+                remaining = (last_poll_time + poll_interval) - time.monotonic()
+                if done_event.wait(timeout=min(max(0.1, remaining), 5.0)):
+                    break
+        finally:
+            # Stop receiving events for this anchor on the shared client
+            unregister_anchor_callback(anchor_hash)
+
         # Determine why we exited the loop
-        final_time = time.time()
+        final_time = time.monotonic()
         total_duration = final_time - start_time
         timed_out = total_duration >= timeout_seconds
         
         if timed_out:
-            print(f"⏰ Loop exited due to TIMEOUT after {total_duration:.1f}s (limit: {timeout_seconds}s)")
+            logger.info("Loop exited due to timeout after %.1fs (limit: %ss)", total_duration, timeout_seconds)
         else:
-            print(f"✅ Loop exited due to COMPLETION after {total_duration:.1f}s")
+            logger.info("Loop exited due to completion after %.1fs", total_duration)
+            # Fold completed responses into the latency estimate
+            _response_time_ewma = 0.8 * _response_time_ewma + 0.2 * total_duration
         
         if not response_complete and not last_content:
             if timed_out:
-                print("⏰ Streaming timeout, no content received")
+                logger.warning("Streaming timeout, no content received")
                 callback("❌ Response timeout - no content received")
             else:
-                print("❌ Loop ended but no content was captured")
+                logger.warning("Loop ended but no content was captured")
                 callback("❌ Response monitoring failed - no content received")
-        
-        # Cleanup
-        if websocket_client:
-            websocket_client.disconnect()
-            
+
     except Exception as e:
-        print(f"❌ Error in streaming monitor: {e}")
+        logger.error("Error in streaming monitor: %s", e)
         callback(f"❌ Error monitoring response: {e}")
 
 
@@ -261,5 +350,6 @@ def start_bridge(interface_instance, api_url: str = 'http://localhost:3000') ->
     except Exception as e:
         print(f"❌ Bridge error: {e}")
     finally:
+        shutdown_monitors()
         if hasattr(interface_instance, 'cleanup'):
             interface_instance.cleanup()
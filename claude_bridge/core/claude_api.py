@@ -3,11 +3,71 @@ Claude Desktop API - Clean HTTP functions for Claude Desktop automation
 Extracted from working parts of the legacy codebase
 """
 
+import collections
+import logging
 import requests
 import json
 import time
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
+
+
+# Shared keep-alive session - avoids tearing down and re-establishing a TCP
+# connection for every API call (the monitor loop polls every few seconds).
+# The pool is sized to bridge_core's monitor executor so concurrent monitors
+# never churn connections, and idempotent requests retry transparently on
+# gateway errors (POST is excluded by the default retry method list, so an
+# inject can never be duplicated).
+_SESSION = requests.Session()
+_SESSION.headers['Content-Type'] = 'application/json'
+_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2,
+                      status_forcelist=[502, 503, 504])))
+
+# The API server is local (localhost:3000), so connects either succeed
+# immediately or the server is down - fail fast instead of blocking the
+# read-timeout budget on a dead socket
+_CONNECT_TIMEOUT = 1.0
+
+# /health and /claude/state are idempotent probes hit by monitor loops and
+# startup checks; a short TTL cache collapses bursts of identical probes
+# into one round-trip. State changes faster than health, so its window is
+# tighter, and an inject invalidates it outright.
+_HEALTH_TTL = 2.0
+_STATE_TTL = 0.5
+_probe_cache: Dict[str, tuple] = {}
+
+
+@lru_cache(maxsize=64)
+def _endpoint(api_url: str, path: str) -> str:
+    """Endpoint URL concatenated once per (base, path) pair, then cached"""
+    return api_url + path
+
+
+def _invalidate_state(api_url: str) -> None:
+    """Drop the cached /claude/state snapshot after a mutating call"""
+    _probe_cache.pop(_endpoint(api_url, '/claude/state'), None)
+
+
+logger = logging.getLogger(__name__)
+
+# orjson (C-implemented) is markedly faster on the multi-KB monitor payloads;
+# fall back to stdlib json when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _loads = json.loads
 
 
 def send_to_claude(message: str, metadata: Optional[Dict] = None, 
@@ -24,35 +84,35 @@ def send_to_claude(message: str, metadata: Optional[Dict] = None,
         Anchor hash for response monitoring, or None if failed
     """
     try:
-        print(f"📤 Sending to Claude: {message[:50]}...")
+        logger.info("Sending to Claude: %.50s...", message)
         
         payload = {
             'message': message,
             'metadata': metadata or {}
         }
         
-        response = requests.post(
-            f"{api_url}/claude/inject",
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
+        response = _SESSION.post(
+            _endpoint(api_url, '/claude/inject'),
+            data=_dumps(payload),
+            timeout=(_CONNECT_TIMEOUT, 30)
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
                 anchor = result.get('anchor')
-                print(f"✅ Message sent with anchor: {anchor}")
+                logger.info("Message sent with anchor: %s", anchor)
+                _invalidate_state(api_url)
                 return anchor
             else:
-                print(f"❌ API error: {result.get('error')}")
+                logger.error("API error: %s", result.get('error'))
                 return None
         else:
-            print(f"❌ HTTP error: {response.status_code}")
+            logger.error("HTTP error: %s", response.status_code)
             return None
             
     except Exception as e:
-        print(f"❌ Send failed: {e}")
+        logger.error("Send failed: %s", e)
         return None
 
 
@@ -70,38 +130,65 @@ def monitor_response(anchor_hash: str, timeout: int = 180,
         Response content when available, or None if failed/timeout
     """
     try:
-        print(f"📡 Monitoring for response with anchor: {anchor_hash}")
+        logger.info("Monitoring for response with anchor: %s", anchor_hash)
         
         payload = {
             'anchor': anchor_hash,
             'timeout': timeout * 1000  # Convert to milliseconds
         }
         
-        response = requests.post(
-            f"{api_url}/claude/monitor",
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=timeout + 10  # Give extra time for HTTP timeout
+        response = _SESSION.post(
+            _endpoint(api_url, '/claude/monitor'),
+            data=_dumps(payload),
+            timeout=(_CONNECT_TIMEOUT, timeout + 10)  # Extra read time for HTTP timeout
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
                 content = result.get('content', '').strip()
-                print(f"✅ Response captured ({len(content)} chars)")
+                logger.info("Response captured (%d chars)", len(content))
                 return content
             else:
-                print(f"❌ Monitor error: {result.get('error')}")
+                logger.error("Monitor error: %s", result.get('error'))
                 return None
         else:
-            print(f"❌ HTTP error: {response.status_code}")
+            logger.error("HTTP error: %s", response.status_code)
             return None
             
     except Exception as e:
-        print(f"❌ Monitor failed: {e}")
+        logger.error("Monitor failed: %s", e)
         return None
 
 
+def send_and_wait(message: str, metadata: Optional[Dict] = None,
+                  timeout: int = 180,
+                  api_url: str = 'http://localhost:3000') -> Tuple[Optional[str], Optional[str]]:
+    """
+    Send a message and wait for the complete response in one call
+
+    The inject and monitor requests are issued back to back on the shared
+    keep-alive session with no intervening work, so the monitor rides the
+    connection the inject just used instead of opening a second one. This
+    is the whole hot path for simple sequential callers (one user message,
+    one Claude reply) without a separate monitoring thread.
+
+    Args:
+        message: Message to send to Claude
+        metadata: Optional metadata to associate with message
+        timeout: How long to wait for the response in seconds
+        api_url: Claude Desktop API server URL
+
+    Returns:
+        Tuple of (anchor_hash, response_content); either may be None on
+        failure
+    """
+    anchor = send_to_claude(message, metadata=metadata, api_url=api_url)
+    if not anchor:
+        return None, None
+    return anchor, monitor_response(anchor, timeout=timeout, api_url=api_url)
+
+
 def extract_response(wait_complete: bool = True, timeout: int = 20,
                     api_url: str = 'http://localhost:3000') -> Optional[str]:
     """
@@ -116,35 +203,34 @@ def extract_response(wait_complete: bool = True, timeout: int = 20,
         Extracted response content, or None if failed
     """
     try:
-        print("📥 Extracting Claude response...")
+        logger.info("Extracting Claude response...")
         
         params = {
             'waitForComplete': str(wait_complete).lower(),
             'timeout': timeout * 1000
         }
         
-        response = requests.get(
-            f"{api_url}/claude/extract",
+        response = _SESSION.get(
+            _endpoint(api_url, '/claude/extract'),
             params=params,
-            headers={'Content-Type': 'application/json'},
-            timeout=timeout + 5
+            timeout=(_CONNECT_TIMEOUT, timeout + 5)
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
                 content = result.get('content', '').strip()
-                print(f"✅ Response extracted ({len(content)} chars)")
+                logger.info("Response extracted (%d chars)", len(content))
                 return content
             else:
-                print(f"❌ Extract error: {result.get('error')}")
+                logger.error("Extract error: %s", result.get('error'))
                 return None
         else:
-            print(f"❌ HTTP error: {response.status_code}")
+            logger.error("HTTP error: %s", response.status_code)
             return None
             
     except Exception as e:
-        print(f"❌ Extract failed: {e}")
+        logger.error("Extract failed: %s", e)
         return None
 
 
@@ -158,27 +244,29 @@ def get_desktop_state(api_url: str = 'http://localhost:3000') -> Optional[Dict]:
     Returns:
         Desktop state information, or None if failed
     """
+    url = _endpoint(api_url, '/claude/state')
+    cached = _probe_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < _STATE_TTL:
+        return cached[1]
+
+    state = None
     try:
-        response = requests.get(
-            f"{api_url}/claude/state",
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
-        
+        response = _SESSION.get(url, timeout=(_CONNECT_TIMEOUT, 10))
+
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
-                return result.get('state', {})
+                state = result.get('state', {})
             else:
-                print(f"❌ State error: {result.get('error')}")
-                return None
+                logger.error("State error: %s", result.get('error'))
         else:
-            print(f"❌ HTTP error: {response.status_code}")
-            return None
-            
+            logger.error("HTTP error: %s", response.status_code)
+
     except Exception as e:
-        print(f"❌ State check failed: {e}")
-        return None
+        logger.error("State check failed: %s", e)
+
+    _probe_cache[url] = (time.monotonic(), state)
+    return state
 
 
 def health_check(api_url: str = 'http://localhost:3000') -> bool:
@@ -191,26 +279,40 @@ def health_check(api_url: str = 'http://localhost:3000') -> bool:
     Returns:
         True if server is healthy, False otherwise
     """
+    url = _endpoint(api_url, '/health')
+    cached = _probe_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL:
+        return cached[1]
+
+    healthy = False
     try:
-        response = requests.get(
-            f"{api_url}/health",
-            timeout=5
-        )
-        
+        response = _SESSION.get(url, timeout=(_CONNECT_TIMEOUT, 5))
+
         if response.status_code == 200:
-            result = response.json()
-            return result.get('status') == 'healthy'
-        else:
-            return False
-            
+            result = _loads(response.content)
+            healthy = result.get('status') == 'healthy'
+
     except Exception:
-        return False
+        pass
+
+    _probe_cache[url] = (time.monotonic(), healthy)
+    return healthy
 
 import socketio
 import threading
 from typing import Callable
 
 
+# Events the streaming pipeline actually consumes; everything else
+# (heartbeats, state broadcasts) can be dropped before Python dispatch
+_STREAM_EVENTS = frozenset({
+    'response_update',
+    'response_complete',
+    'response_streaming',
+    'response_monitored'
+})
+
+
 # WebSocket client for real-time API monitoring
 class ClaudeAPIWebSocketClient:
     """
@@ -218,12 +320,21 @@ class ClaudeAPIWebSocketClient:
     Used for investigation and potentially streaming responses
     """
     
-    def __init__(self, api_url: str = 'http://localhost:3000'):
-        """Initialize WebSocket client"""
+    def __init__(self, api_url: str = 'http://localhost:3000',
+                 events: Optional[frozenset] = None):
+        """
+        Initialize WebSocket client
+        
+        Args:
+            api_url: API server URL
+            events: Optional set of event names to dispatch; None means all
+        """
         self.api_url = api_url
+        self.events = events
         self.sio = socketio.Client(logger=False)
         self.connected = False
         self.event_callback = None
+        self._connected_event = threading.Event()
         
         # Register event handlers
         self.sio.on('connect', self._on_connect)
@@ -242,39 +353,43 @@ class ClaudeAPIWebSocketClient:
         """
         try:
             self.event_callback = event_callback
-            print(f"🔌 Connecting to WebSocket: {self.api_url}")
+            logger.info("Connecting to WebSocket: %s", self.api_url)
             
             self.sio.connect(self.api_url)
-            
-            # Wait a moment for connection
-            time.sleep(0.5)
-            return self.connected
+
+            # Wait for the actual handshake instead of a fixed 500ms nap
+            return self._connected_event.wait(timeout=5.0)
             
         except Exception as e:
-            print(f"❌ WebSocket connection failed: {e}")
+            logger.error("WebSocket connection failed: %s", e)
             return False
     
     def disconnect(self):
         """Disconnect from WebSocket server"""
         if self.connected:
-            print("🔌 Disconnecting from WebSocket")
+            logger.info("Disconnecting from WebSocket")
             self.sio.disconnect()
     
     def _on_connect(self):
         """Handle WebSocket connection"""
         self.connected = True
-        print("✅ WebSocket connected")
+        self._connected_event.set()
+        logger.info("WebSocket connected")
     
     def _on_disconnect(self):
         """Handle WebSocket disconnection"""
         self.connected = False
-        print("🔌 WebSocket disconnected")
+        self._connected_event.clear()
+        logger.info("WebSocket disconnected")
     
     def _on_any_event(self, event_name, *args):
         """Handle any WebSocket event (for investigation)"""
-        print(f"📡 WebSocket event: {event_name}")
-        if args:
-            print(f"📡 Event data: {args}")
+        # Cheap set-membership filter before any further dispatch work
+        if self.events is not None and event_name not in self.events:
+            return
+        logger.debug("WebSocket event: %s", event_name)
+        if args and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event data: %r", args)
         
         # Call user callback if provided
         if self.event_callback:
@@ -282,26 +397,27 @@ class ClaudeAPIWebSocketClient:
 
 
 def start_websocket_monitoring(api_url: str = 'http://localhost:3000', 
-                             event_callback: Optional[Callable] = None) -> ClaudeAPIWebSocketClient:
+                             event_callback: Optional[Callable] = None,
+                             events: Optional[frozenset] = None) -> ClaudeAPIWebSocketClient:
     """
     Start WebSocket monitoring in background thread
     
     Args:
         api_url: API server URL
         event_callback: Optional callback for events
+        events: Optional set of event names to dispatch; None means all
         
     Returns:
         WebSocket client instance
     """
-    client = ClaudeAPIWebSocketClient(api_url)
+    client = ClaudeAPIWebSocketClient(api_url, events=events)
     
     def monitor_thread():
         if client.connect(event_callback):
-            print("🔍 WebSocket monitoring started")
-            # Keep connection alive
+            logger.info("WebSocket monitoring started")
+            # Block until disconnect instead of waking every second
             try:
-                while client.connected:
-                    time.sleep(1)
+                client.sio.wait()
             except KeyboardInterrupt:
                 pass
         client.disconnect()
@@ -312,36 +428,100 @@ def start_websocket_monitoring(api_url: str = 'http://localhost:3000',
     return client
 
 
-def investigate_websocket_events(api_url: str = 'http://localhost:3000', 
-                               duration: int = 30):
+# Process-wide WebSocket client shared by all in-flight monitors.
+# Events are demultiplexed to per-anchor callbacks, so each message costs a
+# registry entry instead of a fresh TCP+Socket.IO handshake and thread.
+_WS_LOCK = threading.Lock()
+_WS_CLIENT: Optional[ClaudeAPIWebSocketClient] = None
+_ANCHOR_CALLBACKS: Dict[str, Callable] = {}
+
+
+def _dispatch_anchor_event(event_name, *args):
+    """Route a WebSocket event to the monitor registered for its anchor"""
+    data = args[0] if args else None
+    if not isinstance(data, dict):
+        return
+    callback = _ANCHOR_CALLBACKS.get(data.get('anchor'))
+    if callback:
+        callback(event_name, *args)
+
+
+def get_shared_websocket_client(api_url: str = 'http://localhost:3000') -> ClaudeAPIWebSocketClient:
     """
-    Investigate what events the API WebSocket sends (for debugging)
+    Get the shared WebSocket client, starting it on first use
     
+    Args:
+        api_url: API server URL
+        
+    Returns:
+        The long-lived WebSocket client instance
+    """
+    global _WS_CLIENT
+    with _WS_LOCK:
+        if _WS_CLIENT is not None:
+            if _WS_CLIENT.connected:
+                return _WS_CLIENT
+            # A client mid-handshake is pending, not dead: wait for it
+            # (bounded) so a burst of monitors shares the one connection
+            # instead of each replacing it with its own
+            if _WS_CLIENT._connected_event.wait(timeout=5.0):
+                return _WS_CLIENT
+            # Genuinely stale - tear it down before publishing a
+            # replacement, or its socket and keep-alive thread leak and
+            # keep dispatching duplicate events
+            try:
+                _WS_CLIENT.sio.disconnect()
+            except Exception:
+                pass
+        _WS_CLIENT = start_websocket_monitoring(api_url, event_callback=_dispatch_anchor_event,
+                                                events=_STREAM_EVENTS)
+        return _WS_CLIENT
+
+
+def register_anchor_callback(anchor_hash: str, callback: Callable) -> None:
+    """Register a callback to receive events for a specific anchor"""
+    with _WS_LOCK:
+        _ANCHOR_CALLBACKS[anchor_hash] = callback
+
+
+def unregister_anchor_callback(anchor_hash: str) -> None:
+    """Remove the callback registered for an anchor"""
+    with _WS_LOCK:
+        _ANCHOR_CALLBACKS.pop(anchor_hash, None)
+
+
+def investigate_websocket_events(api_url: str = 'http://localhost:3000',
+                               duration: int = 30, verbose: bool = False):
+    """
+    Investigate what events the API WebSocket sends (for debugging)
+
     Args:
         api_url: API server URL
         duration: How long to monitor in seconds
+        verbose: Print each event as it arrives (otherwise summary only)
     """
-    events_received = []
-    
+    # Bounded buffer - a chatty server can't balloon memory during a long
+    # investigation, and timestamps are formatted only for the summary
+    events_received = collections.deque(maxlen=10_000)
+
     def log_event(event_name, *args):
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        events_received.append({
-            'timestamp': timestamp,
-            'event': event_name,
-            'data': args
-        })
-        print(f"[{timestamp}] 📡 {event_name}: {args}")
-    
+        events_received.append((datetime.now(), event_name, args))
+        if verbose:
+            print(f"📡 {event_name}: {args}")
+
     print(f"🔍 Investigating WebSocket events for {duration} seconds...")
     client = start_websocket_monitoring(api_url, log_event)
-    
+
     # Wait for investigation period
     time.sleep(duration)
-    
+
     client.disconnect()
-    
+
     print(f"\n📊 Investigation complete! Received {len(events_received)} events:")
-    for event in events_received:
-        print(f"  [{event['timestamp']}] {event['event']}")
-    
-    return events_received
+    for timestamp, event_name, _ in events_received:
+        print(f"  [{timestamp.strftime('%H:%M:%S.%f')[:-3]}] {event_name}")
+
+    return [
+        {'timestamp': ts.strftime('%H:%M:%S.%f')[:-3], 'event': name, 'data': data}
+        for ts, name, data in events_received
+    ]
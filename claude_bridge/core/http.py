@@ -0,0 +1,11 @@
+"""
+Shared HTTP session for bridge components
+Keeps keep-alive connections to the local API server and debug port pooled
+across the recurring health-check and reset paths
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
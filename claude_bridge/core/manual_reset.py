@@ -2,25 +2,32 @@
 Manual Reset Commands - Handle bridge reset functionality
 """
 
+import re
 import subprocess
 import time
 import os
 import signal
 from typing import Dict, Any, Optional, Tuple
 
+from .http import SESSION
+from .paths import RESTART_SCRIPT
+from .proc_utils import scan_cmdlines, pids_matching
+
+# Single pass over each incoming message: matches "!reset" at the start or
+# after whitespace, capturing the optional target word
+_RESET_RE = re.compile(r'(?i)(?:^|\s)!reset(?:\s+(\w+))?')
+
 
 class ManualResetHandler:
     """Handler for manual reset commands sent via chat interface"""
     
-    def __init__(self):
-        self.reset_commands = {
-            'all': self._reset_all,
-            'claude': self._reset_claude,
-            'api': self._reset_api,
-            'bridge': self._reset_bridge,
-            'help': self._reset_help,
-            'status': self._reset_status
-        }
+    # All bridge units in one tuple so multi-unit operations stay a single
+    # systemctl (and thus a single sudo/PAM round)
+    SYSTEMD_UNITS = ('claude-bridge.target',)
+    
+    # Valid targets; dispatch resolves to the matching _reset_<target> method,
+    # so no per-instance dict of bound methods is needed
+    _RESET_COMMANDS = frozenset({'all', 'claude', 'api', 'bridge', 'help', 'status'})
     
     def handle_reset_command(self, message: str, user_info: Optional[Dict] = None) -> Tuple[bool, str]:
         """
@@ -33,17 +40,17 @@ class ManualResetHandler:
         Returns:
             Tuple of (was_handled, response_message)
         """
-        # Check if this is a reset command
-        if not self._is_reset_command(message):
+        # One regex pass covers both detection and target extraction
+        match = _RESET_RE.search(message)
+        if not match:
             return False, ""
         
-        # Extract command target
-        target = self._extract_reset_target(message)
+        target = (match.group(1) or 'help').lower()
         
         # Execute the reset
         try:
-            if target in self.reset_commands:
-                response = self.reset_commands[target]()
+            if target in self._RESET_COMMANDS:
+                response = getattr(self, f'_reset_{target}')()
                 
                 # Special handling for bridge restart - execute the actual restart after response
                 if target == 'bridge':
@@ -51,32 +58,12 @@ class ManualResetHandler:
                 
                 return True, response
             else:
-                available = ', '.join(self.reset_commands.keys())
+                available = ', '.join(sorted(self._RESET_COMMANDS))
                 return True, f"❌ Unknown reset target: {target}\nAvailable: {available}"
                 
         except Exception as e:
             return True, f"❌ Reset failed: {str(e)}"
     
-    def _is_reset_command(self, message: str) -> bool:
-        """Check if message is a reset command"""
-        clean_msg = message.lower().strip()
-        return clean_msg.startswith('!reset') or ' !reset' in clean_msg
-    
-    def _extract_reset_target(self, message: str) -> str:
-        """Extract the reset target from the command"""
-        # Remove mentions and normalize
-        clean_msg = message.lower().strip()
-        
-        # Find !reset and extract target
-        if '!reset' in clean_msg:
-            parts = clean_msg.split('!reset', 1)[1].strip().split()
-            if parts:
-                return parts[0]
-            else:
-                return 'help'  # Default to help if no target specified
-        
-        return 'help'
-    
     def _reset_all(self) -> str:
         """Full system reset - Claude Desktop, API, and Bridge services"""
         steps = []
@@ -89,7 +76,7 @@ class ManualResetHandler:
             
             # Step 2: Stop bridge services
             steps.append("🛑 Stopping bridge services...")
-            result = subprocess.run(['sudo', 'systemctl', 'stop', 'claude-bridge.target'], 
+            result = subprocess.run(['sudo', '-n', 'systemctl', 'stop', *self.SYSTEMD_UNITS],
                                   capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 steps.append("✅ Bridge services stopped")
@@ -107,7 +94,7 @@ class ManualResetHandler:
             
             # Step 5: Start bridge services
             steps.append("🚀 Starting bridge services...")
-            result = subprocess.run(['sudo', 'systemctl', 'start', 'claude-bridge.target'],
+            result = subprocess.run(['sudo', '-n', 'systemctl', 'start', '--no-block', *self.SYSTEMD_UNITS],
                                   capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 steps.append("✅ Bridge services started")
@@ -134,11 +121,13 @@ class ManualResetHandler:
         """Reset only the API service"""
         try:
             print("🔄 Executing API restart...")
-            result = subprocess.run(['sudo', 'systemctl', 'restart', 'claude-bridge-api'],
+            result = subprocess.run(['sudo', '-n', 'systemctl', 'restart', 'claude-bridge-api'],
                                   capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
-                # Check if the service is actually running
-                status_result = subprocess.run(['sudo', 'systemctl', 'is-active', 'claude-bridge-api'],
+                # Check if the service is actually running - `show` needs no
+                # root, so this skips a second sudo/PAM round
+                status_result = subprocess.run(['systemctl', 'show', '-p', 'ActiveState',
+                                                '--value', 'claude-bridge-api'],
                                              capture_output=True, text=True, timeout=10)
                 if status_result.returncode == 0 and status_result.stdout.strip() == 'active':
                     return "✅ API service restarted successfully and is running"
@@ -163,16 +152,14 @@ class ManualResetHandler:
     def _execute_bridge_restart_after_response(self) -> None:
         """Execute the actual bridge restart after sending response (called separately)"""
         try:
-            import threading
-            import time
-            
-            def delayed_restart():
-                time.sleep(2)  # Give time for response to be sent
-                subprocess.run(['sudo', 'systemctl', 'restart', 'claude-bridge'],
-                             capture_output=True, text=True, timeout=30)
-            
-            restart_thread = threading.Thread(target=delayed_restart, daemon=True)
-            restart_thread.start()
+            # Detached child in its own session - survives this process dying
+            # during the restart and leaves no sleeping thread behind
+            subprocess.Popen(
+                ['/bin/sh', '-c', 'sleep 2 && sudo -n systemctl restart claude-bridge'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
         except Exception as e:
             print(f"❌ Bridge restart execution error: {e}")
     
@@ -182,29 +169,25 @@ class ManualResetHandler:
             # Check service status using process inspection instead of systemctl
             services_status = []
             
-            # Check processes
-            ps_result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, timeout=5)
-            ps_output = ps_result.stdout
+            # One pass over /proc covers all the process checks
+            matched = scan_cmdlines((b'npm run api', b'npm run bridge', b'claude', b'appimage'))
             
             # Check API service
-            api_running = 'npm run api' in ps_output
-            api_status = "✅ Running" if api_running else "❌ Not running"
+            api_status = "✅ Running" if b'npm run api' in matched else "❌ Not running"
             services_status.append(f"• **API Service**: {api_status}")
             
             # Check Bridge service  
-            bridge_running = 'npm run bridge' in ps_output
-            bridge_status = "✅ Running" if bridge_running else "❌ Not running"
+            bridge_status = "✅ Running" if b'npm run bridge' in matched else "❌ Not running"
             services_status.append(f"• **Bridge Service**: {bridge_status}")
             
             # Check Claude Desktop process
-            claude_running = 'claude' in ps_output.lower() and 'appimage' in ps_output.lower()
+            claude_running = b'claude' in matched and b'appimage' in matched
             claude_status = "✅ Running" if claude_running else "❌ Not running"
             services_status.append(f"• **Claude Desktop**: {claude_status}")
             
             # Check Chrome Debug Protocol
             try:
-                import requests
-                debug_response = requests.get('http://localhost:9223/json', timeout=3)
+                debug_response = SESSION.get('http://localhost:9223/json', timeout=3)
                 debug_status = "✅ Accessible" if debug_response.status_code == 200 else "❌ Not accessible"
             except:
                 debug_status = "❌ Not accessible"
@@ -212,8 +195,7 @@ class ManualResetHandler:
             
             # Check API health endpoint
             try:
-                import requests
-                health_response = requests.get('http://localhost:3000/health', timeout=3)
+                health_response = SESSION.get('http://localhost:3000/health', timeout=3)
                 if health_response.status_code == 200:
                     health_data = health_response.json()
                     api_health = "✅ Healthy" if health_data.get('status') == 'healthy' else "⚠️ Unhealthy"
@@ -260,40 +242,23 @@ Available reset targets:
     def _kill_desktop_commander_processes(self) -> None:
         """Kill any stray desktop-commander processes"""
         try:
-            # Find desktop-commander processes
-            result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'desktop-commander' in line and 'grep' not in line:
-                        # Extract PID (second column)
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            try:
-                                pid = int(parts[1])
-                                os.kill(pid, signal.SIGTERM)
-                                print(f"🔫 Killed desktop-commander PID {pid}")
-                            except (ValueError, ProcessLookupError):
-                                pass  # Process already gone or invalid PID
+            for pid in pids_matching(b'desktop-commander'):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    print(f"🔫 Killed desktop-commander PID {pid}")
+                except ProcessLookupError:
+                    pass  # Process already gone
         except Exception as e:
             print(f"⚠️ Warning killing desktop-commander processes: {e}")
     
     def _restart_claude_desktop(self) -> str:
         """Restart Claude Desktop using the restart script"""
         try:
-            # Look for restart script in the project directory
-            current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            script_path = os.path.join(current_dir, "restart_claude_with_debugging.sh")
-            
-            if not os.path.exists(script_path):
-                return f"❌ Restart script not found at {script_path}"
-            
-            
-            if not os.path.exists(script_path):
-                return f"❌ Restart script not found: {script_path}"
+            if not RESTART_SCRIPT.is_file():
+                return f"❌ Restart script not found at {RESTART_SCRIPT}"
             
             # Execute the restart script
-            result = subprocess.run(['bash', script_path], 
+            result = subprocess.run(['bash', str(RESTART_SCRIPT)], 
                                   capture_output=True, text=True, timeout=60)
             
             if result.returncode == 0:
@@ -4,8 +4,96 @@ Extracted from working parts of the legacy codebase
 """
 
 import re
-from datetime import datetime
-from typing import Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional, Callable
+
+# Compiled once at import so per-message formatting skips the re module's
+# pattern-cache lookup
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Lines the bridge injects around Claude's output ("===" banners and our own
+# [BRIDGE: ...] frames), removed in a single multiline pass over the whole
+# document instead of a per-line startswith loop
+_NOISE_LINE_RE = re.compile(r'^(?:\[BRIDGE:|===)[^\n]*\n?', re.MULTILINE)
+
+# Trailing whitespace per line, likewise one pass inside the regex engine
+_TRAIL_WS_RE = re.compile(r'[ \t\r]+$', re.MULTILINE)
+
+# Newline runs left behind by blank lines, collapsed when parsing
+_NEWLINE_RUN_RE = re.compile(r'\n{2,}')
+
+# Default mention handles and thread commands stripped from incoming messages
+DEFAULT_MENTIONS = ('@claude-oum', '@claude')
+THREAD_COMMANDS = ('/newthread', '--new-thread', '/new')
+
+
+@lru_cache(maxsize=32)
+def _mention_pattern(patterns: tuple):
+    """Compile a removal pattern for a set of mention/command literals"""
+    # Longest alternatives first so '/new' cannot shadow '/newthread'
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(p) for p in ordered))
+
+
+_MENTION_RE = _mention_pattern(DEFAULT_MENTIONS + THREAD_COMMANDS)
+
+# Frame timestamps only need second granularity; cache the rendered string
+# per integer second so bursts of messages skip repeated strftime calls
+_ts_cache = (0, '')
+
+# Platform-specific formatters, keyed by platform type. All current
+# platforms take Claude's markdown as-is; a platform needing its own
+# rendering (e.g. HTML for a web app) registers a callable here
+_PLATFORM_FORMATTERS: Dict[str, Callable[[str], str]] = {}
+
+
+def _frame_timestamp() -> str:
+    """Current timestamp string, memoized by integer second"""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec)))
+    return _ts_cache[1]
+
+
+def _strip_noise(text: str) -> str:
+    """
+    Remove bridge frames, UI banners and trailing line whitespace
+
+    Shared by format_for_platform and parse_response_content. Each filter
+    is a single compiled-regex substitution scanning the buffer in C, so a
+    multi-KB response never pays the old split/per-line-loop/join triple
+    pass or its list-of-lines allocation.
+
+    Args:
+        text: Raw text to filter
+    """
+    # Cheap substring gate: most responses contain no noise markers at all,
+    # so the removal pass is skipped entirely for them
+    if '[BRIDGE:' in text or '===' in text:
+        text = _NOISE_LINE_RE.sub('', text)
+    return _TRAIL_WS_RE.sub('', text)
+
+
+def frame_prefix(user_info: Optional[Dict] = None,
+                 platform_info: Optional[Dict] = None) -> str:
+    """
+    Build just the bracketed context prefix for a framed message
+    
+    Useful for callers that transmit the prefix once and stream the body
+    separately, instead of copying the prefix into every chunk.
+    
+    Args:
+        user_info: Information about the user (username, etc.)
+        platform_info: Information about the platform/channel
+        
+    Returns:
+        The "[BRIDGE: ...]" prefix without the message body
+    """
+    platform_name = platform_info.get('name', 'unknown') if platform_info else 'unknown'
+    username = user_info.get('username', 'unknown') if user_info else 'unknown'
+    return f"[BRIDGE: #{platform_name} | User: {username} | {_frame_timestamp()}]"
 
 
 def frame_message_with_context(message: str, user_info: Optional[Dict] = None,
@@ -21,22 +109,7 @@ def frame_message_with_context(message: str, user_info: Optional[Dict] = None,
     Returns:
         Framed message with context
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    # Extract platform details
-    platform_name = 'unknown'
-    if platform_info:
-        platform_name = platform_info.get('name', 'unknown')
-    
-    # Extract user details  
-    username = 'unknown'
-    if user_info:
-        username = user_info.get('username', 'unknown')
-    
-    # Create context frame
-    framed_message = f"[BRIDGE: #{platform_name} | User: {username} | {timestamp}] {message}"
-    
-    return framed_message
+    return frame_prefix(user_info, platform_info) + ' ' + message
 
 
 def format_for_platform(response_text: str, platform_type: str = 'generic') -> str:
@@ -53,37 +126,19 @@ def format_for_platform(response_text: str, platform_type: str = 'generic') -> s
     if not response_text or not response_text.strip():
         return ""
     
-    # Clean up the response text
-    lines = response_text.split('\n')
-    clean_lines = []
-    
-    for line in lines:
-        # Only strip trailing whitespace, preserve leading for formatting
-        line_cleaned = line.rstrip()
-        
-        # Skip obvious UI noise but keep most content
-        if (not line_cleaned.startswith('===') and
-            not line_cleaned.startswith('=== EXTRACTED') and
-            not line_cleaned.startswith('=== END') and
-            not line_cleaned.startswith('[BRIDGE:')):  # Skip our own frame messages
-            clean_lines.append(line_cleaned)
-    
-    # Join with proper line breaks
-    formatted = '\n'.join(clean_lines)
-    
-    # Remove excessive blank lines (more than 2 consecutive)
-    formatted = re.sub(r'\n{3,}', '\n\n', formatted)
+    # Drop UI-noise lines and trailing whitespace (preserving blank lines
+    # for formatting), then collapse excessive blank lines
+    formatted = _strip_noise(response_text)
+    # Most responses have no 3+ newline runs; a C-level substring check
+    # avoids entering the regex engine for them
+    if '\n\n\n' in formatted:
+        formatted = _BLANK_LINES_RE.sub('\n\n', formatted)
     
-    # Platform-specific formatting
-    if platform_type == 'mattermost':
-        # Mattermost supports markdown
-        pass  # Keep as-is for now
-    elif platform_type == 'terminal':
-        # Terminal might need different formatting
-        pass  # Keep as-is for now  
-    elif platform_type == 'webapp':
-        # Web app might need HTML conversion
-        pass  # Keep as-is for now
+    # Platform-specific formatting via dispatch table - one hash lookup
+    # instead of a string-compare chain per response
+    platform_formatter = _PLATFORM_FORMATTERS.get(platform_type)
+    if platform_formatter is not None:
+        formatted = platform_formatter(formatted)
     
     # Trim whitespace
     formatted = formatted.strip()
@@ -104,20 +159,12 @@ def parse_response_content(raw_content: str) -> str:
     if not raw_content:
         return ""
     
-    # Filter out our own bridge messages from the response
-    lines = raw_content.split('\n')
-    filtered_lines = []
-    
-    for line in lines:
-        # Skip lines that look like bridge messages or UI elements
-        if (not line.startswith('[BRIDGE:') and
-            not line.startswith('===') and  
-            len(line.strip()) > 0):
-            filtered_lines.append(line)
-    
-    filtered_content = '\n'.join(filtered_lines).strip()
-    
-    return filtered_content
+    # Filter out our own bridge messages, UI elements and blank lines
+    filtered_content = _strip_noise(raw_content)
+    if '\n\n' in filtered_content:
+        filtered_content = _NEWLINE_RUN_RE.sub('\n', filtered_content)
+
+    return filtered_content.strip()
 
 
 def is_substantial_response(content: str, min_length: int = 50) -> bool:
@@ -131,18 +178,16 @@ def is_substantial_response(content: str, min_length: int = 50) -> bool:
     Returns:
         True if response is substantial, False otherwise
     """
-    if not content or not content.strip():
-        return False
+    # Strip once and reuse - three separate .strip() calls each rescanned
+    # and reallocated the content
+    stripped = content.strip() if content else ''
     
     # Check length
-    if len(content.strip()) < min_length:
+    if len(stripped) < min_length:
         return False
     
     # Check if it's just our own input echoed back
-    if content.strip().startswith('[BRIDGE:'):
-        return False
-    
-    return True
+    return not stripped.startswith('[BRIDGE:')
 
 
 def clean_mention_from_message(message: str, mention_patterns: list = None) -> str:
@@ -156,16 +201,11 @@ def clean_mention_from_message(message: str, mention_patterns: list = None) -> s
     Returns:
         Cleaned message without mentions
     """
-    if not mention_patterns:
-        mention_patterns = ['@claude-oum', '@claude']
-    
-    cleaned = message
-    for pattern in mention_patterns:
-        cleaned = cleaned.replace(pattern, '').strip()
-    
-    # Remove new thread commands
-    thread_commands = ['/new', '--new-thread', '/newthread']
-    for cmd in thread_commands:
-        cleaned = cleaned.replace(cmd, '').strip()
-    
-    return cleaned
+    if mention_patterns:
+        pattern = _mention_pattern(tuple(mention_patterns) + THREAD_COMMANDS)
+    else:
+        pattern = _MENTION_RE
+    
+    # One alternation pass removes every mention and thread command instead
+    # of a full scan + reallocation per literal
+    return pattern.sub('', message).strip()
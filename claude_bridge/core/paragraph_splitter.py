@@ -3,7 +3,43 @@ Hybrid paragraph splitter: Stream content in real-time, then delete and organize
 """
 
 from typing import Optional, Callable, List
+import logging
 import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import; splitting long paragraphs happens per streamed
+# response and should not pay the pattern-cache probe each time
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# A paragraph is a run of text not containing a blank line; finditer yields
+# them lazily so extraction never materializes one substring per paragraph
+# up front the way content.split('\n\n') does
+_PARA_RE = re.compile(r'[^\n](?:[^\n]|\n(?!\n))*')
+
+# Completion-indicator phrases as one case-insensitive alternation: a single
+# scan of the content instead of one substring search (plus a lowercased
+# copy) per phrase
+_COMPLETION_INDICATORS = (
+    "Let me know how",
+    "should have seen",
+    "completion indicator",
+    "test worked",
+    "streaming worked",
+    "approach works",
+    "Let's try it",
+)
+_COMPLETION_RE = re.compile(
+    '|'.join(re.escape(p) for p in _COMPLETION_INDICATORS), re.IGNORECASE)
+# Overlap window so an indicator spanning two chunks is still caught when
+# only the newly arrived suffix is scanned
+_MAX_INDICATOR_LEN = max(map(len, _COMPLETION_INDICATORS))
+
+# Streaming-update throttle: edit the platform message only after this much
+# new content or this much elapsed time, whichever comes first
+_MIN_UPDATE_DELTA = 64
+_MIN_UPDATE_INTERVAL = 0.25
 
 
 class ParagraphStreamingSplitter:
@@ -29,48 +65,102 @@ class ParagraphStreamingSplitter:
         self.delete_message = delete_message_fn
         self.max_paragraph_length = max_paragraph_length
         
-        # State tracking
+        # State tracking - content is kept as a list of received chunks and
+        # only joined when the full text is actually needed, so appending a
+        # delta never recopies everything received so far
         self.streaming_message_id: Optional[str] = None
-        self.full_content = ""
+        self._chunks: List[str] = []
+        self._content_len = 0
+        self._full_cache: Optional[str] = ""
         self.sent_paragraphs = 0
         self.is_finalized = False
-        
-    def process_chunk(self, new_content: str, is_complete: bool = False) -> None:
+        self._scan_tail = ""
+        self._last_sent_len = 0
+        self._last_update_ts = 0.0
+
+    @property
+    def full_content(self) -> str:
+        """The accumulated content, joined lazily and cached"""
+        if self._full_cache is None:
+            self._full_cache = ''.join(self._chunks)
+        return self._full_cache
+
+    def process_delta(self, delta: str, is_complete: bool = False) -> None:
         """
-        Process content: stream in real-time, then organize at completion
-        
+        Process newly received content: stream in real-time, then organize
+        at completion
+
         Args:
-            new_content: The complete content received so far
+            delta: Content added since the previous call
             is_complete: Whether this is the final chunk
         """
         if self.is_finalized:
             return
-            
-        # Update content
-        self.full_content = new_content
-        
+
+        if delta:
+            self._chunks.append(delta)
+            self._content_len += len(delta)
+            self._full_cache = None
+
         # During streaming: show content in real-time
-        if not is_complete and not self._looks_like_completion(new_content):
+        if not is_complete and not self._completion_in_delta(delta):
             self._stream_content()
         else:
             # At completion: delete streaming message and send clean paragraphs
-            print(f"🔄 Response complete - organizing into paragraphs ({len(new_content)} chars)")
+            print(f"🔄 Response complete - organizing into paragraphs ({self._content_len} chars)")
             self._organize_into_paragraphs()
             self.is_finalized = True
+
+    def process_chunk(self, new_content: str, is_complete: bool = False) -> None:
+        """
+        Compatibility shim for callers that pass the complete content so far
+
+        Args:
+            new_content: The complete content received so far
+            is_complete: Whether this is the final chunk
+        """
+        if (len(new_content) >= self._content_len and
+                new_content.startswith(self.full_content)):
+            delta = new_content[self._content_len:]
+        else:
+            # Content shrank or its interior changed (snapshots are not
+            # guaranteed prefix-stable: the noise filter can delete a
+            # partial trailing line once the full line arrives, and the
+            # polling fallback delivers unformatted content) - start over
+            # from the new text rather than splicing corrupted output
+            self._chunks = []
+            self._content_len = 0
+            self._full_cache = ""
+            self._scan_tail = ""
+            delta = new_content
+        self.process_delta(delta, is_complete)
     
     def _stream_content(self) -> None:
         """Stream content in real-time in a single message"""
         if self.streaming_message_id is None:
-            # Start streaming message
+            # Start streaming message immediately for perceived latency
             self.streaming_message_id = self.send_message(self.full_content)
-            print(f"🌊 Started streaming message (ID: {self.streaming_message_id})")
+            self._last_sent_len = self._content_len
+            self._last_update_ts = time.monotonic()
+            logger.debug("Started streaming message (ID: %s)", self.streaming_message_id)
+            return
+        
+        # Each update is a full network round-trip; batch small deltas so N
+        # streamed tokens produce far fewer than N edits
+        now = time.monotonic()
+        if (self._content_len - self._last_sent_len < _MIN_UPDATE_DELTA and
+                now - self._last_update_ts < _MIN_UPDATE_INTERVAL):
+            return
+        
+        success = self.update_message(self.streaming_message_id, self.full_content)
+        if success:
+            self._last_sent_len = self._content_len
+            self._last_update_ts = now
+            # Deferred %-formatting: nothing is built unless DEBUG is on,
+            # and the write never contends for stdout on the stream path
+            logger.debug("Updated streaming message: %d chars", self._content_len)
         else:
-            # Update streaming message
-            success = self.update_message(self.streaming_message_id, self.full_content)
-            if success:
-                print(f"📝 Updated streaming message: {len(self.full_content)} chars")
-            else:
-                print(f"⚠️ Failed to update streaming message {self.streaming_message_id}")
+            logger.warning("Failed to update streaming message %s", self.streaming_message_id)
     
     def _organize_into_paragraphs(self) -> None:
         """Delete streaming message and send clean paragraph messages"""
@@ -85,13 +175,17 @@ class ParagraphStreamingSplitter:
         # Process content into clean paragraphs
         paragraphs = self._extract_paragraphs(self.full_content)
         
-        # Send each paragraph as separate message
-        for i, paragraph in enumerate(paragraphs, 1):
+        # Send each paragraph as separate message; log once at the end
+        # instead of a print (allocation + flush) per paragraph
+        log_lines = []
+        for paragraph in paragraphs:
             if paragraph.strip():
                 message_id = self.send_message(paragraph.strip())
                 self.sent_paragraphs += 1
-                print(f"📨 Sent paragraph #{self.sent_paragraphs}: {len(paragraph)} chars")
-        
+                log_lines.append(f"#{self.sent_paragraphs}: {len(paragraph)} chars")
+        if log_lines:
+            print("📨 Sent paragraphs: " + ", ".join(log_lines))
+
         # Send completion indicator
         if self.sent_paragraphs > 1:
             completion_msg = f"✅ Response complete ({self.sent_paragraphs} paragraphs)"
@@ -99,27 +193,36 @@ class ParagraphStreamingSplitter:
     
     def _extract_paragraphs(self, content: str) -> List[str]:
         """Extract paragraphs from content using double newlines"""
-        # Split on double newlines
-        paragraphs = content.split('\n\n')
+        # Fast path: if the whole content fits under the limit, no single
+        # paragraph can exceed it, so the per-paragraph length branch and
+        # the sentence splitter can never fire
+        if len(content) <= self.max_paragraph_length:
+            return _PARA_RE.findall(content)
         
-        # Handle very long paragraphs
+        # Stream paragraphs straight off the match iterator; only fitted
+        # paragraphs are cut out of the content
         result = []
-        for paragraph in paragraphs:
+        for match in _PARA_RE.finditer(content):
+            paragraph = match.group(0)
             if len(paragraph) > self.max_paragraph_length:
-                # Split long paragraphs on sentences
-                sentences = self._split_into_sentences(paragraph)
-                current_chunk = ""
-                
-                for sentence in sentences:
-                    test_chunk = current_chunk + (" " if current_chunk else "") + sentence
-                    if len(test_chunk) > self.max_paragraph_length and current_chunk:
-                        result.append(current_chunk.strip())
-                        current_chunk = sentence
+                # Split long paragraphs on sentences; track fragments and a
+                # running length so nothing is joined until a chunk is
+                # actually emitted (no throwaway concat per sentence)
+                parts = []
+                cur_len = 0
+
+                for sentence in self._split_into_sentences(paragraph):
+                    add_len = len(sentence) + (1 if parts else 0)
+                    if cur_len + add_len > self.max_paragraph_length and parts:
+                        result.append(' '.join(parts))
+                        parts = [sentence]
+                        cur_len = len(sentence)
                     else:
-                        current_chunk = test_chunk
-                
-                if current_chunk.strip():
-                    result.append(current_chunk.strip())
+                        parts.append(sentence)
+                        cur_len += add_len
+
+                if parts:
+                    result.append(' '.join(parts))
             else:
                 result.append(paragraph)
         
@@ -127,35 +230,32 @@ class ParagraphStreamingSplitter:
     
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences for long paragraph handling"""
-        sentence_pattern = r'(?<=[.!?])\s+'
-        sentences = re.split(sentence_pattern, text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
+    def _completion_in_delta(self, delta: str) -> bool:
+        """Scan only the newly received delta for a completion indicator
+
+        Re-searching the full accumulated content each chunk is quadratic
+        in response size. A tail of the previously scanned text is kept so
+        an indicator split across two deltas is still caught.
+        """
+        window = self._scan_tail + delta
+        self._scan_tail = window[1 - _MAX_INDICATOR_LEN:]
+        return self._looks_like_completion(window)
+    
     def _looks_like_completion(self, content: str) -> bool:
         """Heuristic to detect if content looks complete"""
-        if not content:
-            return False
-        
-        completion_indicators = [
-            "Let me know how",
-            "should have seen", 
-            "completion indicator",
-            "test worked",
-            "streaming worked",
-            "approach works",
-            "Let's try it"
-        ]
-        
-        content_lower = content.lower()
-        for indicator in completion_indicators:
-            if indicator.lower() in content_lower:
-                return True
-        
-        return False
+        return bool(content) and _COMPLETION_RE.search(content) is not None
     
     def reset(self) -> None:
         """Reset state for new conversation"""
         self.streaming_message_id = None
-        self.full_content = ""
+        self._chunks = []
+        self._content_len = 0
+        self._full_cache = ""
         self.sent_paragraphs = 0
         self.is_finalized = False
+        self._scan_tail = ""
+        self._last_sent_len = 0
+        self._last_update_ts = 0.0
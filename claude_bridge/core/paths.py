@@ -0,0 +1,9 @@
+"""
+Project paths resolved once at import time
+"""
+
+from pathlib import Path
+
+# claude_bridge/core/paths.py -> project root is two levels above the package
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RESTART_SCRIPT = PROJECT_ROOT / 'restart_claude_with_debugging.sh'
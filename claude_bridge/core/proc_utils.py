@@ -0,0 +1,88 @@
+"""
+Process table helpers - direct /proc scanning instead of forking `ps aux`
+Avoids a fork+exec+pipe and materializing the whole process table as text
+"""
+
+import os
+
+
+def scan_cmdlines(needles: tuple) -> set:
+    """
+    Scan /proc/<pid>/cmdline for byte needles in a single pass
+
+    Args:
+        needles: Tuple of byte strings to look for
+
+    Returns:
+        Set of the needles that matched at least one process
+    """
+    found = set()
+    remaining = set(needles)
+    self_pid = str(os.getpid())
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return found
+
+    with entries:
+        for entry in entries:
+            if not remaining:
+                break  # Everything matched - stop scanning early
+            name = entry.name
+            if not name.isdigit() or name == self_pid:
+                continue
+            try:
+                with open(f'/proc/{name}/cmdline', 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue  # Process exited or is inaccessible
+            if not data:
+                continue
+            data = data.replace(b'\x00', b' ').lower()
+            for needle in tuple(remaining):
+                if needle in data:
+                    found.add(needle)
+                    remaining.discard(needle)
+
+    return found
+
+
+def pids_matching(needle: bytes) -> list:
+    """
+    Find PIDs whose cmdline contains the needle (excluding this process)
+
+    Args:
+        needle: Byte string to look for in process command lines
+
+    Returns:
+        List of matching PIDs as ints
+    """
+    pids = []
+    self_pid = str(os.getpid())
+    # NUL separators only need rewriting when the needle spans arguments
+    needs_join = b' ' in needle
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return pids
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.isdigit() or name == self_pid:
+                continue
+            try:
+                with open(f'/proc/{name}/cmdline', 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if not data:
+                continue
+            if needs_join:
+                data = data.replace(b'\x00', b' ')
+            if needle in data:
+                pids.append(int(name))
+
+    return pids
@@ -12,6 +12,17 @@ class BridgeInterface(ABC):
     All platform implementations must inherit from this
     """
     
+    # Slot the base attributes: config/running checks sit in polling loops,
+    # and slot access is an array index instead of a __dict__ lookup.
+    # Subclasses without their own __slots__ still get a __dict__ for any
+    # extra attributes they set.
+    __slots__ = ('config', 'running')
+    
+    # Platform identifier as a class attribute: subclasses that know their
+    # type statically set this once instead of answering a method call on
+    # every formatted message
+    platform_type = 'generic'
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the interface
@@ -63,12 +74,13 @@ class BridgeInterface(ABC):
     def get_platform_type(self) -> str:
         """
         Get the platform type identifier
-        Override this in subclasses
+        Subclasses set the platform_type class attribute instead of
+        overriding this
         
         Returns:
             Platform type string (e.g., 'mattermost', 'terminal', 'webapp')
         """
-        return 'generic'
+        return self.platform_type
 
 
 class StreamingInterface(BridgeInterface):
@@ -76,6 +88,8 @@ class StreamingInterface(BridgeInterface):
     Extended interface for platforms that support streaming/real-time updates
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def update_response(self, target: str, message_id: str, 
                        updated_content: str) -> bool:
@@ -107,6 +121,8 @@ class PollingInterface(BridgeInterface):
     Interface for platforms that need to poll for messages
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def poll_for_messages(self) -> None:
         """
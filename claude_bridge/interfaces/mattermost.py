@@ -3,24 +3,68 @@ Mattermost Interface - Bridge interface for Mattermost platform
 Extracted from working parts of the legacy codebase
 """
 
+import json
+import logging
+import re
 import requests
+import signal
 import time
-import threading
-from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional
 
 from .base import PollingInterface
-from ..core.bridge_core import handle_incoming_message
+from ..core.bridge_core import handle_incoming_message, shutdown_monitors
+from ..core.claude_api import _dumps, _loads
 from ..core.manual_reset import ManualResetHandler
 from ..core.health_monitor import HealthMonitor
 from ..core.paragraph_splitter import ParagraphStreamingSplitter
 
 
+logger = logging.getLogger(__name__)
+
+# Classifies command words after a mention hit in one scan: new-thread
+# requests and health-status queries (both word orders), without the
+# repeated .lower() copies and substring searches per command literal
+_COMMAND_RE = re.compile(
+    r"(?P<newthread>!new(?:thread|-thread)?)"
+    r"|(?P<health>\bhealth\b.*?\b(?:status|check)\b|\b(?:status|check)\b.*?\bhealth\b)",
+    re.IGNORECASE | re.DOTALL)
+
+
+class _LRUSet:
+    """
+    Fixed-capacity set for post-ID dedup - membership and insert stay O(1)
+    while the oldest entries are evicted, so memory no longer grows with
+    every post the bot has ever seen
+    """
+    
+    def __init__(self, max_size: int = 100_000):
+        self._entries = OrderedDict()
+        self._max_size = max_size
+    
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+    
+    def add(self, key) -> None:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            return
+        entries[key] = None
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
+
+
 class MattermostInterface(PollingInterface):
     """
     Mattermost platform interface for Claude Desktop bridge
     """
     
+    platform_type = 'mattermost'
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Mattermost interface
@@ -38,6 +82,10 @@ class MattermostInterface(PollingInterface):
         
         # Optional configuration
         self.mention_patterns = config.get('mention_patterns', ['@claude-oum', '@claude'])
+        # One case-insensitive alternation: a single scan per message with
+        # no lowercased copy, instead of one substring search per pattern
+        self._mention_re = re.compile(
+            '|'.join(re.escape(p) for p in self.mention_patterns), re.IGNORECASE)
         
         # Request headers
         self.headers = {
@@ -45,9 +93,41 @@ class MattermostInterface(PollingInterface):
             "Content-Type": "application/json"
         }
         
+        # One pooled keep-alive session for all Mattermost API calls - a
+        # fresh TCP+TLS handshake per request is pure overhead on a hot
+        # loop. Idempotent requests retry transparently on gateway errors
+        # (POST is excluded by the default retry method list, so a send
+        # can never be duplicated).
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504]))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # State tracking
-        self.last_check = datetime.now()
-        self.processed_posts = set()
+        self.processed_posts = _LRUSet()
+        # Per-channel high-water marks (ms) so a poll never re-fetches posts
+        # another channel's cycle already covered. Unseen channels start
+        # from the interface start time: a lookback window would re-answer
+        # pre-startup mentions after every restart, because the dedup set
+        # is empty in a fresh process
+        self.last_check_per_channel: Dict[str, int] = {}
+        self._started_ms = int(time.time() * 1000)
+        # Channel list changes rarely; cache it instead of one extra HTTP
+        # GET per poll
+        self._channels_cache: Optional[list] = None
+        self._channels_cache_ts = 0.0
+        # The same handful of users mention the bot repeatedly; cache their
+        # profiles for a few minutes instead of a GET per mention
+        self._user_cache: OrderedDict = OrderedDict()
+        # Fetches for the fallback polling path run concurrently over the
+        # pooled session, so N channels cost roughly one round-trip of wall
+        # time instead of N
+        self._poll_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mm-poll')
+        self._tick = 0
         
         # Manual reset handler
         self.reset_handler = ManualResetHandler()
@@ -69,8 +149,8 @@ class MattermostInterface(PollingInterface):
         print(f"📱 Monitoring for mentions: {', '.join(self.mention_patterns)}")
         print("🛑 Press Ctrl+C to stop\n")
         
-        # Get channels to monitor
-        channels = self.get_channels()
+        # Get channels to monitor (also primes the channel cache)
+        channels = self._get_channels_cached()
         if not channels:
             print("❌ No channels accessible")
             return
@@ -82,61 +162,233 @@ class MattermostInterface(PollingInterface):
         print("🏥 Health monitoring started")
         
         self.running = True
-        try:
-            while self.running:
-                self.poll_for_messages()
-                time.sleep(self.get_poll_interval())
-                
-        except KeyboardInterrupt:
+        
+        # Flip running via stop() on SIGINT/SIGTERM so the listener loops
+        # exit at the next iteration with the health monitor, poll pool and
+        # session torn down, instead of KeyboardInterrupt unwinding out of
+        # a request mid-flight
+        def _shutdown(signum, frame):
             print("\n🛑 Stopping Mattermost bridge...")
             self.stop()
+        
+        try:
+            signal.signal(signal.SIGINT, _shutdown)
+            signal.signal(signal.SIGTERM, _shutdown)
+        except ValueError:
+            pass  # Not on the main thread; Ctrl+C stays a KeyboardInterrupt
+        
+        # Event-driven listener first; REST polling only as a fallback
+        if not self.listen_websocket():
+            self.listen_polling()
+    
+    def listen_websocket(self) -> bool:
+        """
+        Consume the Mattermost WebSocket event stream and react to posted
+        events as they arrive
+        
+        Replaces the per-channel REST polling (one GET per channel per
+        interval, re-parsing already-seen posts) with a single long-lived
+        connection and per-message dispatch.
+        
+        Returns:
+            False if the websocket client is unavailable or the connection
+            keeps failing, so the caller can fall back to polling
+        """
+        try:
+            import websocket
+        except ImportError:
+            print("⚠️ websocket-client not installed - falling back to REST polling")
+            return False
+        
+        ws_url = (self.mattermost_url
+                  .replace('https://', 'wss://', 1)
+                  .replace('http://', 'ws://', 1)) + '/api/v4/websocket'
+        
+        backoff = 1
+        consecutive_failures = 0
+        while self.running:
+            try:
+                ws = websocket.create_connection(ws_url, timeout=45)
+            except Exception as e:
+                consecutive_failures += 1
+                if consecutive_failures >= 10:
+                    print(f"❌ WebSocket failed {consecutive_failures} times - falling back to REST polling")
+                    return False
+                print(f"⚠️ WebSocket connect failed ({e}), retrying in {backoff}s...")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+            
+            # Failure counters only reset once the connection proves stable
+            # (see the connection-lost path below) - resetting right after
+            # the auth send let an accept-then-close failure mode spin
+            connected_at = time.monotonic()
+
+            try:
+                # Authenticate the connection (control frames like ping are
+                # answered by the websocket library inside recv)
+                ws.send(json.dumps({
+                    "seq": 1,
+                    "action": "authentication_challenge",
+                    "data": {"token": self.bot_token}
+                }))
+                print("🔌 WebSocket connected - listening for posts")
+
+                while self.running:
+                    raw = ws.recv()
+                    if not raw:
+                        continue
+                    event = json.loads(raw)
+                    if event.get('event') != 'posted':
+                        continue
+                    
+                    data = event.get('data', {})
+                    try:
+                        # The post rides inside the event as a JSON string
+                        post = json.loads(data.get('post', '{}'))
+                    except ValueError:
+                        continue
+                    post_id = post.get('id')
+                    if not post_id:
+                        continue
+                    
+                    channel = {
+                        'id': post.get('channel_id'),
+                        'name': data.get('channel_display_name') or data.get('channel_name', 'unknown')
+                    }
+                    # Same shape as one entry of a polled posts response, so
+                    # mention handling and processed_posts semantics carry over
+                    self._check_for_mentions({'posts': {post_id: post}}, channel)
+            except Exception as e:
+                if self.running:
+                    # A connection that died young is a failure, not a blip:
+                    # an expired token or a proxy that accepts the upgrade
+                    # then closes would otherwise reconnect in a tight spin
+                    # and never trip the polling fallback
+                    if time.monotonic() - connected_at < 30:
+                        consecutive_failures += 1
+                        if consecutive_failures >= 10:
+                            print(f"❌ WebSocket dropped {consecutive_failures} times - falling back to REST polling")
+                            return False
+                        print(f"⚠️ WebSocket connection lost ({e}), retrying in {backoff}s...")
+                        time.sleep(backoff)
+                        backoff = min(backoff * 2, 60)
+                    else:
+                        consecutive_failures = 0
+                        backoff = 1
+                        print(f"⚠️ WebSocket connection lost ({e}) - reconnecting...")
+            finally:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+        
+        return True
+    
+    def listen_polling(self) -> None:
+        """Fallback REST polling loop"""
+        while self.running:
+            self.poll_for_messages()
+            time.sleep(self.get_poll_interval())
     
     def stop(self) -> None:
-        """Stop the interface"""
+        """Stop the interface (idempotent)"""
         self.running = False
+        # Release in-flight response monitors too, or their non-daemon
+        # pool threads hold up process exit until the monitor timeout
+        shutdown_monitors()
         self.health_monitor.stop_monitoring()
+        self._poll_pool.shutdown(wait=False)
+        self.session.close()
         print("🏥 Health monitoring stopped")
     
     def poll_for_messages(self) -> None:
         """Poll for new messages and process mentions"""
         try:
-            current_time = datetime.now()
-            
-            # Get channels to monitor
-            channels = self.get_channels()
+            # Get channels to monitor (cached with a TTL)
+            channels = self._get_channels_cached()
             if not channels:
                 return
             
-            # Check each channel for new messages
-            for channel in channels:
-                posts_data = self.get_recent_posts(channel['id'], self.last_check)
-                if posts_data:
+            # Fetch all channels concurrently, then process the results
+            # serially so mention handling and dedup stay single-threaded.
+            # High-water marks still only advance after a successful fetch.
+            since_by_channel = {
+                channel['id']: self.last_check_per_channel.get(channel['id'], self._started_ms)
+                for channel in channels
+            }
+            futures = [
+                (channel, self._poll_pool.submit(
+                    self.get_recent_posts, channel['id'], since_by_channel[channel['id']]))
+                for channel in channels
+            ]
+            
+            for channel, future in futures:
+                posts_data = future.result()
+                if posts_data is None:
+                    continue
+                
+                channel_id = channel['id']
+                since_ms = since_by_channel[channel_id]
+                posts = posts_data.get('posts') or {}
+                if posts:
                     self._check_for_mentions(posts_data, channel)
+                    since_ms = max(since_ms,
+                                   max(p.get('create_at', 0) for p in posts.values()))
+                self.last_check_per_channel[channel_id] = since_ms
             
-            self.last_check = current_time
-            print(".", end="", flush=True)  # Activity indicator
+            # Heartbeat: one log line per 60 ticks instead of an unbuffered
+            # one-byte write(2) on every poll
+            self._tick += 1
+            if self._tick % 60 == 0:
+                logger.info("polling heartbeat: %d cycles", self._tick)
             
         except Exception as e:
-            print(f"❌ Error polling messages: {e}")
+            logger.error("Error polling messages: %s", e)
+    
+    def _get_channels_cached(self, ttl: float = 300) -> Optional[list]:
+        """Get the monitored channel list, refetching only when stale"""
+        now = time.time()
+        if self._channels_cache is not None and now - self._channels_cache_ts < ttl:
+            return self._channels_cache
+        
+        channels = self.get_channels()
+        if channels is not None:
+            self._channels_cache = channels
+            self._channels_cache_ts = now
+            return channels
+        # Fetch failed - keep serving the stale list rather than nothing
+        return self._channels_cache
     
     def _check_for_mentions(self, posts_data: Dict, channel: Dict) -> None:
         """Check posts for bot mentions and process them"""
         if not posts_data or 'posts' not in posts_data:
             return
             
+        # Bind hot-loop attributes to locals: LOAD_FAST instead of a
+        # module/attribute lookup per post
+        processed_posts = self.processed_posts
+        bot_user_id = self.bot_user_id
+        mention_search = self._mention_re.search
+
+        # Regular messages from the same user within one delivery batch
+        # (a poll cycle, or one websocket event) are coalesced into a
+        # single Claude round-trip instead of one inject per post
+        batches: Dict[str, Dict] = {}
+
         for post_id, post in posts_data['posts'].items():
             # Skip if already processed
-            if post_id in self.processed_posts:
+            if post_id in processed_posts:
                 continue
                 
             # Skip bot's own messages
-            if post.get('user_id') == self.bot_user_id:
+            if post.get('user_id') == bot_user_id:
                 continue
                 
             message = post.get('message', '')
             
             # Check for mentions
-            if any(pattern.lower() in message.lower() for pattern in self.mention_patterns):
+            if mention_search(message):
                 print(f"\n🎯 Mention detected: {message[:100]}...")
                 
                 # Get user info first (needed for both reset commands and regular messages)
@@ -150,81 +402,119 @@ class MattermostInterface(PollingInterface):
                     # Send reset response immediately
                     self.send_response(channel['id'], reset_response)
                     # Mark as processed and continue to next message
-                    self.processed_posts.add(post_id)
+                    processed_posts.add(post_id)
                     continue
                 
+                # Classify command words in a single pass over the message
+                new_thread = False
+                health_command = False
+                for cmd_match in _COMMAND_RE.finditer(message):
+                    if cmd_match.lastgroup == 'newthread':
+                        new_thread = True
+                    else:
+                        health_command = True
+                
                 # Check for health status commands
-                if 'health' in message.lower() and any(cmd in message.lower() for cmd in ['status', 'check']):
+                if health_command:
                     print(f"🏥 Health status command detected")
                     health_status = self._get_health_status_message()
                     self.send_response(channel['id'], health_status)
-                    self.processed_posts.add(post_id)
+                    processed_posts.add(post_id)
                     continue
                 
                 # Regular message processing (not a reset command)
                 print(f"💬 Regular message, sending to Claude...")
-                
-                # Check for new thread command
-                new_thread = any(cmd in message.lower() for cmd in ['!new', '!newthread', '!new-thread'])
+
                 if new_thread:
                     print("🆕 New conversation thread requested")
-                
-                # Platform info
-                platform_info = {
-                    'name': channel.get('name', 'unknown'),
-                    'id': channel.get('id'),
-                    'type': 'mattermost'
-                }
-                
-                # Create response callback with hybrid streaming approach
-                paragraph_splitter = None
-                
-                def response_callback(response_content: str):
-                    nonlocal paragraph_splitter
-                    
-                    if paragraph_splitter is None:
-                        # Initialize paragraph splitter with channel-specific functions
-                        def send_fn(content):
-                            return self.send_response(channel['id'], content)
-                        
-                        def update_fn(msg_id, content):
-                            return self.update_message(msg_id, content)
-                        
-                        def delete_fn(msg_id):
-                            return self.delete_message(msg_id)
-                        
-                        paragraph_splitter = ParagraphStreamingSplitter(
-                            send_message_fn=send_fn,
-                            update_message_fn=update_fn,
-                            delete_message_fn=delete_fn
-                        )
-                    
-                    # Process the streaming content with hybrid approach
-                    paragraph_splitter.process_chunk(response_content)
-                
-                # Handle the message
-                handle_incoming_message(
-                    message=message,
-                    user_info=user_info,
-                    platform_info=platform_info,
-                    platform_type='mattermost',
-                    response_callback=response_callback,
-                    api_url=self.api_url,
-                    new_thread=new_thread
+
+                # Queue for dispatch after the batch has been scanned; the
+                # posts map's iteration order is not chronological (the API
+                # ships a separate 'order' array for that), so keep
+                # create_at alongside each message for sorting at flush
+                user_id = post.get('user_id')
+                queued = (post.get('create_at', 0), message)
+                batch = batches.get(user_id)
+                if batch is None:
+                    batches[user_id] = {'messages': [queued],
+                                        'user_info': user_info,
+                                        'new_thread': new_thread}
+                else:
+                    batch['messages'].append(queued)
+                    batch['new_thread'] = batch['new_thread'] or new_thread
+
+            # Mark as processed
+            processed_posts.add(post_id)
+
+        if not batches:
+            return
+
+        # Platform info
+        platform_info = {
+            'name': channel.get('name', 'unknown'),
+            'id': channel.get('id'),
+            'type': 'mattermost'
+        }
+
+        # One framed inject (and one streamed reply) per user in the batch;
+        # a burst of posts no longer costs a Claude round-trip per post
+        for batch in batches.values():
+            messages = batch['messages']
+            if len(messages) > 1:
+                print(f"📦 Combining {len(messages)} burst posts into one Claude call")
+                # Chronological order, not JSON-map order
+                messages.sort(key=lambda queued: queued[0])
+
+            # Create response callback with hybrid streaming approach
+            response_callback = self._make_response_callback(channel['id'])
+
+            # Handle the message
+            handle_incoming_message(
+                message='\n---\n'.join(text for _, text in messages),
+                user_info=batch['user_info'],
+                platform_info=platform_info,
+                platform_type='mattermost',
+                response_callback=response_callback,
+                api_url=self.api_url,
+                new_thread=batch['new_thread']
+            )
+    
+    def _make_response_callback(self, channel_id: str):
+        """
+        Build the streaming response callback for a channel
+        
+        Hoisted out of the mention loop so the closure set is created once
+        per handled message instead of re-defining three nested functions
+        inside the per-post iteration.
+        
+        Args:
+            channel_id: Channel the response should be delivered to
+        """
+        paragraph_splitter = None
+        
+        def response_callback(response_content: str):
+            nonlocal paragraph_splitter
+            
+            if paragraph_splitter is None:
+                # partial is a C-level callable - cheaper per streamed chunk
+                # than a Python closure frame, and update/delete need no
+                # wrapper at all
+                paragraph_splitter = ParagraphStreamingSplitter(
+                    send_message_fn=partial(self.send_response, channel_id),
+                    update_message_fn=self.update_message,
+                    delete_message_fn=self.delete_message
                 )
             
-            # Mark as processed
-            self.processed_posts.add(post_id)
+            # Process the streaming content with hybrid approach
+            paragraph_splitter.process_chunk(response_content)
+        
+        return response_callback
     
     def send_response(self, target: str, message: str, 
                      reply_to: Optional[str] = None) -> Optional[str]:
         """Send response message to Mattermost channel and return message ID"""
         return self.send_message(target, message, reply_to)
     
-    def get_platform_type(self) -> str:
-        """Get platform type identifier"""
-        return 'mattermost'
-    
     # Mattermost API helper methods (extracted from working legacy code)
     
     def get_channels(self) -> Optional[list]:
@@ -235,58 +525,76 @@ class MattermostInterface(PollingInterface):
             if not team_id:
                 raise ValueError("team_id not provided in configuration")
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.mattermost_url}/api/v4/users/me/teams/{team_id}/channels",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
             else:
-                print(f"❌ Error getting channels: {response.status_code}")
+                logger.error("Error getting channels: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"❌ Error getting channels: {e}")
+            logger.error("Error getting channels: %s", e)
             return None
     
-    def get_recent_posts(self, channel_id: str, since_timestamp: datetime) -> Optional[Dict]:
-        """Get recent posts from a channel"""
+    def get_recent_posts(self, channel_id: str, since_ms: int) -> Optional[Dict]:
+        """Get recent posts from a channel since a millisecond timestamp"""
         try:
-            since_ms = int(since_timestamp.timestamp() * 1000)
-            
-            response = requests.get(
+            response = self.session.get(
                 f"{self.mattermost_url}/api/v4/channels/{channel_id}/posts",
-                headers=self.headers,
-                params={"since": since_ms},
+                # Cap the page size so a backlogged channel can't balloon
+                # one poll response to hundreds of KB of JSON
+                params={"since": since_ms, "per_page": 60},
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                # orjson-backed decode on the hottest polling response
+                return _loads(response.content)
             else:
-                print(f"❌ Error getting posts: {response.status_code}")
+                logger.error("Error getting posts: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"❌ Error getting recent posts: {e}")
+            logger.error("Error getting recent posts: %s", e)
             return None
     
+    _USER_CACHE_TTL = 300  # seconds
+    _USER_CACHE_MAX = 256
+    
     def get_user_info(self, user_id: str) -> Optional[Dict]:
-        """Get user information by ID"""
+        """Get user information by ID (cached with a TTL)"""
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            ts, user = cached
+            if time.time() - ts < self._USER_CACHE_TTL:
+                self._user_cache.move_to_end(user_id)
+                return user
+        
+        user = self._fetch_user_info(user_id)
+        if user is not None:
+            self._user_cache[user_id] = (time.time(), user)
+            self._user_cache.move_to_end(user_id)
+            if len(self._user_cache) > self._USER_CACHE_MAX:
+                self._user_cache.popitem(last=False)
+        return user
+    
+    def _fetch_user_info(self, user_id: str) -> Optional[Dict]:
+        """Fetch user information from the API"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.mattermost_url}/api/v4/users/{user_id}",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
             else:
-                print(f"❌ Error getting user info: {response.status_code}")
+                logger.error("Error getting user info: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"❌ Error getting user info: {e}")
+            logger.error("Error getting user info: %s", e)
             return None
     
     def send_message(self, channel_id: str, message: str, 
@@ -300,23 +608,22 @@ class MattermostInterface(PollingInterface):
             if reply_to_id:
                 data["root_id"] = reply_to_id
                 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.mattermost_url}/api/v4/posts",
-                headers=self.headers,
-                json=data,
+                data=_dumps(data),
                 timeout=15
             )
             
             if response.status_code == 201:
-                post_data = response.json()
+                post_data = _loads(response.content)
                 message_id = post_data.get('id')
-                print(f"✅ Message sent to Mattermost (ID: {message_id})")
+                logger.debug("Message sent to Mattermost (ID: %s)", message_id)
                 return message_id
             else:
-                print(f"❌ Failed to send message: {response.status_code}")
+                logger.error("Failed to send message: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"❌ Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
             return None
     
     def update_message(self, message_id: str, new_content: str) -> bool:
@@ -327,40 +634,38 @@ class MattermostInterface(PollingInterface):
                 "message": new_content
             }
             
-            response = requests.put(
+            response = self.session.put(
                 f"{self.mattermost_url}/api/v4/posts/{message_id}",
-                headers=self.headers,
-                json=data,
+                data=_dumps(data),
                 timeout=15
             )
             
             if response.status_code == 200:
-                print(f"✅ Message updated in Mattermost (ID: {message_id})")
+                logger.debug("Message updated in Mattermost (ID: %s)", message_id)
                 return True
             else:
-                print(f"❌ Failed to update message: {response.status_code}")
+                logger.error("Failed to update message: %s", response.status_code)
                 return False
         except Exception as e:
-            print(f"❌ Error updating message: {e}")
+            logger.error("Error updating message: %s", e)
             return False
     
     def delete_message(self, message_id: str) -> bool:
         """Delete a message (for hybrid streaming approach)"""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.mattermost_url}/api/v4/posts/{message_id}",
-                headers=self.headers,
                 timeout=15
             )
             
             if response.status_code == 200:
-                print(f"✅ Message deleted from Mattermost (ID: {message_id})")
+                logger.debug("Message deleted from Mattermost (ID: %s)", message_id)
                 return True
             else:
-                print(f"❌ Failed to delete message: {response.status_code}")
+                logger.error("Failed to delete message: %s", response.status_code)
                 return False
         except Exception as e:
-            print(f"❌ Error deleting message: {e}")
+            logger.error("Error deleting message: %s", e)
             return False
     
     def _on_health_change(self, component: str, is_healthy: bool, status: dict):
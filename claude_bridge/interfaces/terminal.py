@@ -3,7 +3,6 @@ Terminal Interface - Interactive CLI for Claude Desktop bridge
 Demonstrates the universal bridge architecture
 """
 
-import os
 import sys
 import threading
 from typing import Dict, Any, Optional
@@ -18,10 +17,15 @@ class TerminalInterface(BridgeInterface):
     Provides interactive command-line access to Claude
     """
     
+    platform_type = 'terminal'
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize terminal interface"""
         super().__init__(config)
         self.username = config.get('username', 'terminal-user') if config else 'terminal-user'
+        # One event and callback for the session instead of fresh ones per
+        # input-loop iteration
+        self._response_event = threading.Event()
     
     def start(self) -> None:
         """Start the interactive terminal session"""
@@ -52,35 +56,30 @@ class TerminalInterface(BridgeInterface):
                     self._show_help()
                     continue
                 elif user_input.lower() == 'clear':
-                    os.system('clear' if os.name == 'posix' else 'cls')
+                    # ANSI clear+home: no fork/exec of an external binary
+                    sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+                    sys.stdout.flush()
                     continue
                 
                 # Send to Claude
                 print("Claude: ", end="", flush=True)
                 
-                # Create response callback for terminal output
-                response_event = threading.Event()
-                
-                def response_callback(response_content: str):
-                    print(response_content)
-                    print()  # Extra line for readability
-                    response_event.set()
-                
                 # Process the message
                 user_info = {'username': self.username}
                 platform_info = {'name': 'terminal', 'type': 'cli'}
                 
+                self._response_event.clear()
                 anchor_hash = handle_incoming_message(
                     message=user_input,
                     user_info=user_info,
                     platform_info=platform_info,
                     platform_type='terminal',
-                    response_callback=response_callback
+                    response_callback=self._handle_response
                 )
                 
                 if anchor_hash:
                     # Wait for response (with timeout)
-                    if not response_event.wait(timeout=180):
+                    if not self._response_event.wait(timeout=180):
                         print("❌ Response timeout")
                         print()
                 else:
@@ -96,16 +95,18 @@ class TerminalInterface(BridgeInterface):
         """Stop the interface"""
         self.running = False
     
+    def _handle_response(self, response_content: str) -> None:
+        """Print Claude's response and release the waiting input loop"""
+        print(response_content)
+        print()  # Extra line for readability
+        self._response_event.set()
+    
     def send_response(self, target: str, message: str, 
                      reply_to: Optional[str] = None) -> bool:
         """Send response (not used in terminal mode)"""
         print(message)
         return True
     
-    def get_platform_type(self) -> str:
-        """Get platform type identifier"""
-        return 'terminal'
-    
     def _show_help(self) -> None:
         """Show help information"""
         print()
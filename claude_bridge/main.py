@@ -4,6 +4,7 @@ Universal Claude Desktop Bridge - Main Entry Point
 Support for multiple interface types with clean plugin architecture
 """
 
+import logging
 import sys
 import os
 from typing import Dict, Any
@@ -20,25 +21,49 @@ from claude_bridge.interfaces.terminal import TerminalInterface
 
 def get_mattermost_config() -> Dict[str, Any]:
     """Get Mattermost configuration from environment variables"""
+    # Single reference to the environ proxy; every value below reads from it
+    # directly instead of going through repeated os.getenv calls
+    env = os.environ
+    
     # Required environment variables
     required_vars = ['MATTERMOST_URL', 'MATTERMOST_BOT_TOKEN', 'MATTERMOST_BOT_USER_ID', 'MATTERMOST_TEAM_ID']
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            raise ValueError(f"Missing required environment variable: {var}")
+    missing = [var for var in required_vars if not env.get(var)]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
     
     return {
-        'mattermost_url': os.getenv('MATTERMOST_URL'),
-        'bot_token': os.getenv('MATTERMOST_BOT_TOKEN'),
-        'bot_user_id': os.getenv('MATTERMOST_BOT_USER_ID'),
-        'team_id': os.getenv('MATTERMOST_TEAM_ID'),
-        'mention_patterns': os.getenv('MATTERMOST_MENTION_PATTERNS', '@claude-oum,@claude').split(','),
-        'api_url': os.getenv('CLAUDE_API_URL', 'http://localhost:3000')
+        'mattermost_url': env['MATTERMOST_URL'],
+        'bot_token': env['MATTERMOST_BOT_TOKEN'],
+        'bot_user_id': env['MATTERMOST_BOT_USER_ID'],
+        'team_id': env['MATTERMOST_TEAM_ID'],
+        'mention_patterns': env.get('MATTERMOST_MENTION_PATTERNS', '@claude-oum,@claude').split(','),
+        'api_url': env.get('CLAUDE_API_URL', 'http://localhost:3000')
     }
 
 
+def get_terminal_config() -> Dict[str, Any]:
+    """Get terminal interface configuration from environment variables"""
+    return {'username': os.environ.get('USER', 'terminal-user')}
+
+
+# Interface registry: name -> (config builder, interface class). Adding a
+# platform (e.g. the planned webapp) is one entry here, not another branch
+INTERFACES = {
+    'mattermost': (get_mattermost_config, MattermostInterface),
+    'terminal': (get_terminal_config, TerminalInterface),
+}
+
+
 def main():
     """Main entry point with interface selection"""
+    # Operator-facing chatter moved from print to logging; give it a
+    # handler or everything below WARNING is silently discarded. LOG_LEVEL
+    # lets production quiet this down (e.g. WARNING) without a code change.
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
+
     print("🌉 Universal Claude Desktop Bridge v2.0")
     print("=" * 50)
     
@@ -53,27 +78,21 @@ def main():
     
     interface_type = sys.argv[1].lower()
     
-    # Initialize the requested interface
-    if interface_type == 'mattermost':
-        print("🎯 Initializing Mattermost interface...")
-        config = get_mattermost_config()
-        interface = MattermostInterface(config)
-        
-    elif interface_type == 'terminal':
-        print("🖥️  Initializing Terminal interface...")
-        config = {'username': os.getenv('USER', 'terminal-user')}
-        interface = TerminalInterface(config)
-        
-    elif interface_type == 'webapp':
-        print("❌ Web app interface not yet implemented") 
-        print("💡 Coming soon: Standalone web interface")
-        sys.exit(1)
-        
-    else:
-        print(f"❌ Unknown interface type: {interface_type}")
-        print("Available: mattermost, terminal, webapp")
+    # Initialize the requested interface from the registry
+    try:
+        config_fn, interface_cls = INTERFACES[interface_type]
+    except KeyError:
+        if interface_type == 'webapp':
+            print("❌ Web app interface not yet implemented")
+            print("💡 Coming soon: Standalone web interface")
+        else:
+            print(f"❌ Unknown interface type: {interface_type}")
+            print(f"Available: {', '.join(INTERFACES)}, webapp")
         sys.exit(1)
     
+    print(f"🎯 Initializing {interface_type} interface...")
+    interface = interface_cls(config_fn())
+    
     # Start the bridge
     start_bridge(interface)
 